@@ -1,175 +1,379 @@
 import os
 import re
+import importlib.util
 import pandas as pd
 import numpy as np
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
 import time  # Import the time module for the delay
+from concurrent.futures import ThreadPoolExecutor
+# httpx is used to query the CoinGecko REST API over a persistent HTTP/2 connection
+import httpx
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-# The tabulate library is used for creating formatted tables in the terminal
+# The tabulate library is used for the statistical summary table in the terminal
 from tabulate import tabulate
-# The yfinance library is used to fetch historical stock and crypto data
-import yfinance as yf
-# The matplotlib library is used for creating graphical charts
-import matplotlib.pyplot as plt
-# webdriver-manager is no longer needed for this manual approach, but we can leave it imported.
-from webdriver_manager.chrome import ChromeDriverManager
+# yfinance and matplotlib are slow to import, so they are imported on first use
+# inside load_price_history and get_chart_axes.
 
 # ==============================
 # CONFIGURATION
 # ==============================
 URL = "https://coinmarketcap.com/"
+API_URL = "https://api.coingecko.com/api/v3/coins/markets"
+API_PAGE_SIZE = 250 # Largest page CoinGecko serves; bigger TOP_N values are fetched page by page
+API_MAX_WORKERS = 4
 FILE_NAME = r"F:/crypto mini/crypto_market_data.csv"
 TOP_N = 20
 UPDATE_INTERVAL_SECONDS = 10 # Auto-update every 10 seconds
+CACHE_TTL_SECONDS = 60 # Market data upstream only refreshes about once a minute
+BATCH_WRITE_SECONDS = 600 # Write collected rows to the CSV about every 10 minutes
+# Rows are only logged on real fetches, which happen at most once per cache TTL
+BATCH_FETCHES = max(1, BATCH_WRITE_SECONDS // max(UPDATE_INTERVAL_SECONDS, CACHE_TTL_SECONDS))
+CACHE_FILE = ".cache/top.json"
+HISTORY_CACHE_DIR = ".cache/yf" # Daily price history, refreshed once per day
+CHART_FILE = "historical_growth_chart.png"
 
 # ==============================
 
-def clean_numeric_text(text):
-    """Helper function to clean text like '$1,234.56' or '$1.2T' into a number."""
-    if not isinstance(text, str):
-        return None
-    
-    text = text.replace('$', '').replace(',', '').replace('%', '').strip()
-    
-    multiplier = 1
-    if 'T' in text:
-        multiplier = 1_000_000_000_000
-        text = text.replace('T', '')
-    elif 'B' in text:
-        multiplier = 1_000_000_000
-        text = text.replace('B', '')
-    elif 'M' in text:
-        multiplier = 1_000_000
-        text = text.replace('M', '')
-        
+# A single client is shared across ticks so the TLS/HTTP2 connection is reused.
+# HTTP/2 needs the optional h2 package (pip install 'httpx[http2]'); without it httpx uses HTTP/1.1.
+CLIENT = httpx.Client(
+    http2=importlib.util.find_spec("h2") is not None,
+    timeout=10,
+    headers={"User-Agent": "crypto-auto-tracker/1.0", "Accept": "application/json"},
+)
+
+SUFFIX_MULTIPLIERS = {'T': 1_000_000_000_000, 'B': 1_000_000_000, 'M': 1_000_000}
+NUMERIC_COLUMNS = ["PriceUSD", "Change24h_Percent", "MarketCapUSD"]
+# Per-column number formats for the plain-text tables printed each update
+TABLE_FORMATS = {
+    "PriceUSD": "{:,.4f}".format,
+    "Change24h_Percent": "{:,.2f}".format,
+    "MarketCapUSD": "{:,.0f}".format,
+}
+# Compact dtypes halve the memory scanned by the analysis reductions. Only compute_stats
+# uses them: float32 keeps ~7 significant digits, too few for logged or printed values.
+COLUMN_DTYPES = {"Name": "category", **{col: "float32" for col in NUMERIC_COLUMNS}}
+# Figure and axes reused for every chart instead of allocating new ones each time
+_FIG, _AX = None, None
+# (coin, day) of the chart currently saved in CHART_FILE, so unchanged charts aren't redrawn
+_LAST_CHART = None
+# Last successful fetch, reused until it is older than CACHE_TTL_SECONDS
+_CACHE = {"ts": 0.0, "df": None}
+# Compiled once at import so cleaning never re-parses the patterns
+STRIP_PATTERN = re.compile(r'[\$,%\s]')
+NUMBER_PATTERN = re.compile(r'^(-?\d+\.?\d*)([TBM]?)')
+
+def clean_numeric_column(series):
+    """Vectorized helper to clean a column of text like '$1,234.56' or '$1.2T' into numbers."""
+    parts = series.str.replace(STRIP_PATTERN, '', regex=True).str.extract(NUMBER_PATTERN)
+    multiplier = parts[1].map(SUFFIX_MULTIPLIERS).fillna(1)
+    return pd.to_numeric(parts[0], errors='coerce') * multiplier
+
+def load_cached_cryptos():
+    """Returns (data, fetch time) from the cache if it is still fresh, checking memory first and then disk."""
+    if _CACHE["df"] is not None and time.time() - _CACHE["ts"] < CACHE_TTL_SECONDS:
+        return _CACHE["df"].copy(), _CACHE["ts"]
+
+    # Lets a restarted process reuse data fetched just before it stopped
     try:
-        return float(text) * multiplier
-    except (ValueError, TypeError):
-        return None
-
-def get_top_cryptos(headless=True):
-    """Scrapes the top N cryptocurrencies from CoinMarketCap using Selenium."""
-    # Initialize driver to None so it can be checked in the finally block
-    driver = None
+        mtime = os.path.getmtime(CACHE_FILE)
+        if time.time() - mtime < CACHE_TTL_SECONDS:
+            df = pd.read_json(CACHE_FILE, orient="records")
+            # The file is written right after each fetch, so its mtime is the fetch time
+            _CACHE.update(ts=mtime, df=df)
+            return df.copy(), mtime
+    except (OSError, ValueError):
+        pass
+    return None
+
+def store_cached_cryptos(df, fetched_at):
+    """Keeps a copy of freshly fetched market data in memory and on disk."""
+    _CACHE.update(ts=fetched_at, df=df.copy())
     try:
-        print("🚀 Initializing browser with manual driver path...")
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("window-size=1920,1080")
-
-        driver_path = r"F:\crypto mini\chromedriver.exe"
-        service = Service(executable_path=driver_path)
-        
-        # The driver initialization is now inside the try block
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        print("✅ Chrome driver initialized successfully.")
-        
-        driver.get(URL)
-        print(f"⏳ Navigated to CoinMarketCap. Waiting for the data table to load...")
-        wait = WebDriverWait(driver, 20)
-        
-        table_selector = "table.cmc-table tbody"
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, table_selector)))
-        wait.until(lambda d: len(d.find_elements(By.CSS_SELECTOR, f"{table_selector} tr")) >= TOP_N)
-        print("✅ Data table loaded successfully.")
-
-        rows = driver.find_elements(By.CSS_SELECTOR, f"{table_selector} tr")[:TOP_N]
-        crypto_data = []
-        print(f"Parsing data for top {TOP_N} coins...")
-
-        for row in rows:
-            cols = row.find_elements(By.TAG_NAME, 'td')
-            if len(cols) < 9: # The table structure now often has more columns
-                continue
-
-            try:
-                # === UPDATED SELECTORS TO BE MORE ROBUST ===
-                name = cols[2].find_element(By.CSS_SELECTOR, 'p.coin-item-symbol').text
-                price = clean_numeric_text(cols[3].text)
-                change_24h = clean_numeric_text(cols[5].text)
-                market_cap = clean_numeric_text(cols[7].text)
-                # ============================================
-
-                crypto_data.append({
-                    "Name": name,
-                    "PriceUSD": price,
-                    "Change24h_Percent": change_24h,
-                    "MarketCapUSD": market_cap,
-                })
-            except Exception as e:
-                # This helps debug which rows are failing and why
-                print(f"Could not parse a row, likely an ad or non-standard entry. Skipping. Error: {e}")
-                continue
-        
-        return pd.DataFrame(crypto_data)
-
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        df.to_json(CACHE_FILE, orient="records")
+    except OSError as e:
+        print(f"Could not write cache file {CACHE_FILE}: {e}")
+
+def get_top_cryptos(browser):
+    """Returns (data, fetch time, whether it came from the cache) for the top N cryptocurrencies."""
+    cached = load_cached_cryptos()
+    if cached is not None:
+        print(f"♻️  Using cached market data (refreshed at most every {CACHE_TTL_SECONDS} seconds).")
+        df, fetched_at = cached
+        return df, fetched_at, True
+
+    fetched_at = time.time()
+    df = fetch_top_cryptos(browser)
+    # Partial results are rejected by main(), so don't cache them and block a retry for the whole TTL
+    if len(df) >= TOP_N:
+        store_cached_cryptos(df, fetched_at)
+    return df, fetched_at, False
+
+def fetch_api_page(page, per_page):
+    """Fetches one page of coins, ordered by market cap, from the CoinGecko API."""
+    resp = CLIENT.get(API_URL, params={
+        "vs_currency": "usd",
+        "order": "market_cap_desc",
+        "per_page": per_page,
+        "page": page,
+    })
+    resp.raise_for_status()
+    return resp.json()
+
+def fetch_top_cryptos(browser):
+    """Fetches the top N cryptocurrencies from the CoinGecko API, falling back to scraping CoinMarketCap."""
+    try:
+        print("🚀 Fetching market data from the CoinGecko API...")
+        per_page = min(TOP_N, API_PAGE_SIZE)
+        pages = range(1, -(-TOP_N // per_page) + 1)
+        if len(pages) == 1:
+            records = fetch_api_page(1, per_page)
+        else:
+            # Pages are independent, so request them concurrently over the shared client
+            with ThreadPoolExecutor(max_workers=min(len(pages), API_MAX_WORKERS)) as pool:
+                records = [coin for page in pool.map(lambda p: fetch_api_page(p, per_page), pages) for coin in page]
+
+        df = pd.DataFrame(records[:TOP_N])[["symbol", "current_price", "price_change_percentage_24h", "market_cap"]]
+        df = df.rename(columns={
+            "symbol": "Name",
+            "current_price": "PriceUSD",
+            "price_change_percentage_24h": "Change24h_Percent",
+            "market_cap": "MarketCapUSD",
+        })
+        # CoinGecko returns lowercase symbols; CoinMarketCap (and yfinance tickers) use uppercase
+        df["Name"] = df["Name"].str.upper()
+        print(f"✅ Received data for {len(df)} coins.")
+        return df
     except Exception as e:
-        print(f"❌ An error occurred during scraping: {e}")
-        if driver: # Only take screenshot if driver was initialized
-            driver.save_screenshot("error_screenshot.png")
-            print("📸 A screenshot named 'error_screenshot.png' was saved for debugging.")
-        return pd.DataFrame()
-    finally:
-        # Only try to quit the driver if it was successfully started
-        if driver:
+        print(f"❌ API request failed ({e}). Falling back to browser scraping...")
+        return browser.scrape()
+
+def build_driver(headless=True):
+    """Starts a Chrome instance using the manually downloaded chromedriver."""
+    print("🚀 Initializing browser with manual driver path...")
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("window-size=1920,1080")
+    # Only the table text is read, so skip downloading images, stylesheets and fonts
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+    })
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-extensions")
+
+    driver_path = r"F:\crypto mini\chromedriver.exe"
+    service = Service(executable_path=driver_path)
+
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    print("✅ Chrome driver initialized successfully.")
+    return driver
+
+# Runs inside the page and returns [symbol, price, 24h change, market cap] text per table row
+ROWS_SCRIPT = """
+[...document.querySelectorAll('%s')].slice(0, %d).map(r => {
+    const c = r.querySelectorAll('td');
+    const symbol = c.length >= 9 && c[2].querySelector('p.coin-item-symbol');
+    return symbol ? [symbol.innerText, c[3].innerText, c[5].innerText, c[7].innerText] : null;
+})
+"""
+
+def top_rows_loaded(locator):
+    """Wait condition that returns the table rows as soon as at least TOP_N of them exist."""
+    def _predicate(driver):
+        rows = EC.presence_of_all_elements_located(locator)(driver)
+        return rows if len(rows) >= TOP_N else False
+    return _predicate
+
+def scrape_once(driver):
+    """Scrapes the top N cryptocurrencies from CoinMarketCap using an already running driver."""
+    driver.get(URL)
+    print(f"⏳ Navigated to CoinMarketCap. Waiting for the data table to load...")
+    wait = WebDriverWait(driver, 20, poll_frequency=0.1)
+
+    table_selector = "table.cmc-table tbody"
+    wait.until(top_rows_loaded((By.CSS_SELECTOR, f"{table_selector} tr")))
+    print("✅ Data table loaded successfully.")
+
+    print(f"Parsing data for top {TOP_N} coins...")
+    # One DevTools round trip returns the raw text of every row instead of several WebDriver calls per cell
+    result = driver.execute_cdp_cmd("Runtime.evaluate", {
+        "expression": ROWS_SCRIPT % (f"{table_selector} tr", TOP_N),
+        "returnByValue": True,
+    })
+    rows = result["result"]["value"]
+
+    # Rows with fewer cells or no coin symbol (ads and other non-standard entries) come back as null
+    crypto_data = [row for row in rows if row is not None]
+    if len(crypto_data) < len(rows):
+        print(f"Skipped {len(rows) - len(crypto_data)} rows that were likely ads or non-standard entries.")
+
+    df = pd.DataFrame(crypto_data, columns=["Name"] + NUMERIC_COLUMNS)
+    for col in NUMERIC_COLUMNS:
+        df[col] = clean_numeric_column(df[col])
+    return df
+
+class BrowserSession:
+    """Keeps a single Chrome instance alive across ticks, starting it on first use."""
+
+    def __init__(self, headless=True):
+        self.headless = headless
+        self.driver = None
+
+    def scrape(self):
+        """Scrapes CoinMarketCap, restarting the browser on the next call if anything goes wrong."""
+        try:
+            if self.driver is None:
+                self.driver = build_driver(self.headless)
+            return scrape_once(self.driver)
+        except Exception as e:
+            print(f"❌ An error occurred during scraping: {e}")
+            if self.driver: # Only take screenshot if driver was initialized
+                try:
+                    self.driver.save_screenshot("error_screenshot.png")
+                    print("📸 A screenshot named 'error_screenshot.png' was saved for debugging.")
+                except Exception:
+                    pass
+            # Drop the (possibly broken) browser so the next tick starts a fresh one
+            self.quit()
+            return pd.DataFrame()
+
+    def quit(self):
+        """Closes the browser if it was started."""
+        if self.driver:
             print("Browser closing.")
-            driver.quit()
-
-def save_to_csv(df, filename):
-    """Efficiently appends data to a CSV file."""
-    # The exist_ok=True argument prevents an error if the directory already exists.
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    df["Timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    cols = ["Timestamp"] + [col for col in df.columns if col != "Timestamp"]
-    df = df[cols]
-    
-    write_header = not os.path.exists(filename)
-    df.to_csv(filename, mode='a', header=write_header, index=False)
-    print(f"✅ Data for {len(df)} coins appended successfully to {filename}")
-
-def display_advanced_analysis(df):
-    """Calculates and prints advanced market statistics to the terminal."""
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+def print_table(df, formatters=TABLE_FORMATS):
+    """Prints a DataFrame as a plain aligned table using pandas' own renderer."""
+    print(df.to_string(index=False, formatters={col: fmt for col, fmt in formatters.items() if col in df.columns}))
+
+class CsvAppender:
+    """Appends data to a CSV file in batches through one buffered handle kept open for the whole run."""
+
+    def __init__(self, filename, batch_fetches=BATCH_FETCHES, buffer_size=65536):
+        self.filename = filename
+        self.batch_fetches = batch_fetches
+        self.pending = []
+        # The exist_ok=True argument prevents an error if the directory already exists.
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self.fh = open(filename, 'a', buffering=buffer_size, newline='')
+        # Only write the header for a new (or empty) file
+        self.header_written = self.fh.tell() > 0
+
+    def append(self, df, fetched_at):
+        """Stamps the rows with their fetch time and queues them, writing once a full batch is collected."""
+        df.insert(0, "Timestamp", datetime.fromtimestamp(fetched_at).strftime("%Y-%m-%d %H:%M:%S"))
+        self.pending.append(df)
+
+        if len(self.pending) >= self.batch_fetches:
+            self.flush()
+        else:
+            print(f"🗂️  Data for {len(df)} coins queued ({len(self.pending)}/{self.batch_fetches} fetches before writing to {self.filename})")
+
+    def flush(self):
+        """Writes all queued rows to the file in a single call."""
+        if not self.pending:
+            return
+        batch = pd.concat(self.pending, ignore_index=True)
+        # pandas ends rows with os.linesep, matching rows already in the file on this platform
+        batch.to_csv(self.fh, header=not self.header_written, index=False)
+        self.fh.flush()
+        self.header_written = True
+        self.pending.clear()
+        print(f"✅ Data for {len(batch)} rows appended successfully to {self.filename}")
+
+    def close(self):
+        """Writes any queued rows and closes the file."""
+        if not self.fh.closed:
+            self.flush()
+            self.fh.close()
+
+@dataclass
+class Stats:
+    """Market statistics computed once per update and shared by the display functions."""
+    summary: pd.DataFrame   # describe() of the numeric columns
+    extremes: pd.DataFrame  # Index labels of each column's min/max, rows 'idxmin'/'idxmax'
+    avg_change: float
+    volatility: float
+    weighted_change: float
+    score: np.ndarray       # Recommendation score per row, aligned with df
+
+def compute_stats(df):
+    """Computes every statistic the analysis displays need, once per update."""
+    summary = df[NUMERIC_COLUMNS].describe()
+    extremes = df[NUMERIC_COLUMNS].agg(['idxmin', 'idxmax'])
+
+    mc = df['MarketCapUSD'].to_numpy()
+    ch = df['Change24h_Percent'].to_numpy()
+
+    # Simple scoring model: 50% Market Cap, 50% 24h Change, normalised with describe()'s min/max
+    mc_min, mc_max = summary.at['min', 'MarketCapUSD'], summary.at['max', 'MarketCapUSD']
+    ch_min, ch_max = summary.at['min', 'Change24h_Percent'], summary.at['max', 'Change24h_Percent']
+    mc_norm = (mc - mc_min) / (mc_max - mc_min)
+    ch_norm = (ch - ch_min) / (ch_max - ch_min)
+
+    return Stats(
+        summary=summary,
+        extremes=extremes,
+        avg_change=summary.at['mean', 'Change24h_Percent'],
+        volatility=summary.at['std', 'Change24h_Percent'],
+        weighted_change=(ch * mc).sum() / mc.sum(),
+        score=0.5 * mc_norm + 0.5 * ch_norm,
+    )
+
+def display_advanced_analysis(df, stats):
+    """Prints advanced market statistics to the terminal."""
     print("--- Advanced Market Analysis ---")
     
     # 1. Overall Market Sentiment
-    avg_change = df['Change24h_Percent'].mean()
+    avg_change = stats.avg_change
     sentiment = "Bullish 🐂" if avg_change > 0 else "Bearish 🐻"
     print(f"Overall Market Sentiment: {sentiment} ({avg_change:.2f}% avg change)")
 
     # 2. Price Analysis
-    highest_price_coin = df.loc[df['PriceUSD'].idxmax()]
-    lowest_price_coin = df.loc[df['PriceUSD'].idxmin()]
+    highest_price_coin = df.loc[stats.extremes.at['idxmax', 'PriceUSD']]
+    lowest_price_coin = df.loc[stats.extremes.at['idxmin', 'PriceUSD']]
     print(f"Highest Price Coin: {highest_price_coin['Name']} at ${highest_price_coin['PriceUSD']:,.2f}")
     print(f"Lowest Price Coin: {lowest_price_coin['Name']} at ${lowest_price_coin['PriceUSD']:,.4f}")
     print("--------------------------------\n")
 
 
-def display_highly_advanced_analysis(df):
-    """Calculates and prints highly advanced market statistics."""
+def display_highly_advanced_analysis(df, stats):
+    """Prints highly advanced market statistics."""
     print("--- Highly Advanced Analysis ---")
 
     # 1. Market Volatility
-    volatility = df['Change24h_Percent'].std()
+    volatility = stats.volatility
     print(f"Market Volatility (Std Dev of 24h Change): {volatility:.2f}%")
 
     # 2. Market-Cap Weighted Sentiment
-    weighted_avg_change = (df['Change24h_Percent'] * df['MarketCapUSD']).sum() / df['MarketCapUSD'].sum()
+    weighted_avg_change = stats.weighted_change
     weighted_sentiment = "Bullish 🐂" if weighted_avg_change > 0 else "Bearish 🐻"
     print(f"Market-Cap Weighted Sentiment: {weighted_sentiment} ({weighted_avg_change:.2f}% change)")
 
     # 3. Market Cap Tiers
-    large_cap = df[df['MarketCapUSD'] >= 10_000_000_000].shape[0]
-    mid_cap = df[(df['MarketCapUSD'] >= 1_000_000_000) & (df['MarketCapUSD'] < 10_000_000_000)].shape[0]
-    small_cap = df[df['MarketCapUSD'] < 1_000_000_000].shape[0]
+    # Bins are closed on the left: [-inf, 1B), [1B, 10B), [10B, inf)
+    tiers = pd.cut(df['MarketCapUSD'], bins=[-np.inf, 1_000_000_000, 10_000_000_000, np.inf],
+                   labels=['Small', 'Mid', 'Large'], right=False)
+    counts = tiers.value_counts()
+    large_cap, mid_cap, small_cap = counts['Large'], counts['Mid'], counts['Small']
     print("\nMarket Structure by Cap Tiers:")
     print(f"  - Large-Cap (> $10B): {large_cap} coins")
     print(f"  - Mid-Cap ($1B - $10B): {mid_cap} coins")
@@ -177,42 +381,32 @@ def display_highly_advanced_analysis(df):
 
     # 4. Full Statistical Summary with Coin Names
     print("\nStatistical Summary of Key Metrics:")
-    summary_df = df[['PriceUSD', 'Change24h_Percent', 'MarketCapUSD']].describe()
-
-    # Create a new column for coin name details, initialized as empty strings
-    summary_df['Details'] = ''
+    extremes = stats.extremes
 
     # Get coin names for the 'max' row
-    max_price_name = df.loc[df['PriceUSD'].idxmax(), 'Name']
-    max_change_name = df.loc[df['Change24h_Percent'].idxmax(), 'Name']
-    max_mcap_name = df.loc[df['MarketCapUSD'].idxmax(), 'Name']
-    
+    max_price_name, max_change_name, max_mcap_name = (df.at[i, 'Name'] for i in extremes.loc['idxmax'])
+
     # Get coin names for the 'min' row
-    min_price_name = df.loc[df['PriceUSD'].idxmin(), 'Name']
-    min_change_name = df.loc[df['Change24h_Percent'].idxmin(), 'Name']
-    min_mcap_name = df.loc[df['MarketCapUSD'].idxmin(), 'Name']
+    min_price_name, min_change_name, min_mcap_name = (df.at[i, 'Name'] for i in extremes.loc['idxmin'])
 
-    # Add the coin names to the respective rows in the 'Details' column
-    summary_df.at['max', 'Details'] = f"({max_price_name} / {max_change_name} / {max_mcap_name})"
-    summary_df.at['min', 'Details'] = f"({min_price_name} / {min_change_name} / {min_mcap_name})"
+    # Build the coin name details column in one go; rows other than min/max stay empty
+    details = pd.Series({
+        'max': f"({max_price_name} / {max_change_name} / {max_mcap_name})",
+        'min': f"({min_price_name} / {min_change_name} / {min_mcap_name})",
+    }, index=stats.summary.index).fillna('')
 
-    # Rename the column for clarity
-    summary_df.rename(columns={'Details': 'Coin for Min/Max (Price/Change/MCap)'}, inplace=True)
+    # assign() returns a new frame, so the shared summary is left untouched
+    summary_df = stats.summary.assign(**{'Coin for Min/Max (Price/Change/MCap)': details})
 
     print(tabulate(summary_df, headers='keys', tablefmt='grid'))
     print("--------------------------------\n")
 
-def display_recommendation_assistant(df):
+def display_recommendation_assistant(df, stats):
     """Provides a speculative recommendation based on a simple scoring model."""
     print("--- Final Recommendation Assistant ---")
     print("⚠️  DISCLAIMER: This is not financial advice. All analysis is for educational purposes based on a simplified model and scraped data. Do your own research.")
 
-    # Simple scoring model: 50% Market Cap, 50% 24h Change
-    df['mc_norm'] = (df['MarketCapUSD'] - df['MarketCapUSD'].min()) / (df['MarketCapUSD'].max() - df['MarketCapUSD'].min())
-    df['ch_norm'] = (df['Change24h_Percent'] - df['Change24h_Percent'].min()) / (df['Change24h_Percent'].max() - df['Change24h_Percent'].min())
-    df['score'] = 0.5 * df['mc_norm'] + 0.5 * df['ch_norm']
-    
-    recommendation = df.loc[df['score'].idxmax()]
+    recommendation = df.iloc[int(stats.score.argmax())]
     rec_name = recommendation['Name']
     
     reason = f"Recommended due to a strong combination of high market capitalization (indicating stability) and positive recent momentum ({recommendation['Change24h_Percent']:.2f}%). Its dominant market position suggests a lower risk profile compared to other assets in the list."
@@ -229,18 +423,16 @@ def display_recommendation_assistant(df):
         "Aggressive": 1.20      # 120% annual growth
     }
     
-    projections = []
-    for year in [1, 5, 10]:
-        row = {"Timeframe (Years)": year}
-        for name, rate in scenarios.items():
-            # Project future price with compounding
-            future_price = recommendation['PriceUSD'] * ((1 + rate) ** year)
-            growth_percent = ((future_price - recommendation['PriceUSD']) / recommendation['PriceUSD']) * 100
-            row[f"{name} Growth %"] = f"{growth_percent:,.2f}%"
-        projections.append(row)
-    
-    projection_df = pd.DataFrame(projections)
-    print(tabulate(projection_df, headers='keys', tablefmt='grid', showindex=False))
+    # Compound every scenario over every timeframe in one broadcast: rows are years, columns are rates
+    years = np.array([1, 5, 10])
+    rates = np.array(list(scenarios.values()))
+    growth = ((1 + rates[None, :]) ** years[:, None] - 1) * 100
+
+    projection_df = pd.DataFrame(growth, index=years, columns=[f"{name} Growth %" for name in scenarios])
+    projection_df = projection_df.apply(lambda col: col.map("{:,.2f}%".format))
+    projection_df.index.name = "Timeframe (Years)"
+    projection_df = projection_df.reset_index()
+    print_table(projection_df)
     print("\nNOTE: Projections are based on hypothetical annual growth rates and do not represent actual predictions.")
     # ---------------------------------------------------------
 
@@ -248,21 +440,68 @@ def display_recommendation_assistant(df):
     generate_historical_chart(rec_name)
 
 
+def load_price_history(ticker):
+    """Returns one year of daily prices for ticker, downloading it at most once per day."""
+    today = date.today().isoformat()
+    path = os.path.join(HISTORY_CACHE_DIR, f"{ticker}_{today}.pkl")
+    if os.path.exists(path):
+        try:
+            return pd.read_pickle(path)
+        except Exception as e:
+            # A corrupt cache file would otherwise fail every tick until tomorrow
+            print(f"Discarding unreadable history cache {path}: {e}")
+            os.remove(path)
+
+    # The yfinance library is used to fetch historical stock and crypto data
+    import yfinance as yf
+
+    # Fetch data from Yahoo Finance for the last year
+    data = yf.download(ticker, period="1y")
+    if not data.empty:
+        os.makedirs(HISTORY_CACHE_DIR, exist_ok=True)
+        # Drop this ticker's files from previous days so the cache doesn't grow forever
+        for name in os.listdir(HISTORY_CACHE_DIR):
+            if name.startswith(f"{ticker}_") and name.endswith((".pkl", ".tmp")):
+                os.remove(os.path.join(HISTORY_CACHE_DIR, name))
+        # Write to a temp file first so an interrupted write never leaves a truncated cache file
+        tmp_path = f"{path}.tmp"
+        data.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    return data
+
+def get_chart_axes():
+    """Returns the shared chart figure and axes, creating them on first use."""
+    global _FIG, _AX
+    if _FIG is None:
+        # The matplotlib library is used for creating graphical charts
+        import matplotlib
+        matplotlib.use("Agg") # Charts are only saved to files, so no GUI backend is needed
+        import matplotlib.pyplot as plt
+
+        plt.style.use('seaborn-v0_8-darkgrid')
+        _FIG, _AX = plt.subplots(figsize=(12, 7))
+    return _FIG, _AX
+
 def generate_historical_chart(coin_name):
     """Fetches historical data and generates a graphical chart."""
+    global _LAST_CHART
     print(f"\n--- Historical Price Chart for {coin_name} ---")
+    # The history only changes daily, so the same coin on the same day gives the same chart
+    chart_key = (coin_name, date.today())
+    if chart_key == _LAST_CHART and os.path.exists(CHART_FILE):
+        print(f"✅ Chart for {coin_name} is up to date in '{CHART_FILE}'")
+        return
     try:
-        # Fetch data from Yahoo Finance for the last year
         ticker = f"{coin_name}-USD"
-        data = yf.download(ticker, period="1y")
+        data = load_price_history(ticker)
 
         if data.empty:
             print(f"Could not fetch historical data for {ticker}. The ticker may be incorrect or delisted.")
             return
 
-        # Create the plot
-        plt.style.use('seaborn-v0_8-darkgrid')
-        fig, ax = plt.subplots(figsize=(12, 7))
+        # Create the plot on the shared axes, wiping the previous chart
+        fig, ax = get_chart_axes()
+        ax.clear()
 
         ax.plot(data['Close'], label='Close Price (USD)', color='cyan')
         ax.plot(data['Open'], label='Open Price (USD)', color='magenta', linestyle='--')
@@ -273,14 +512,13 @@ def generate_historical_chart(coin_name):
         ax.set_ylabel('Price (USD)', fontsize=12)
         ax.legend()
         ax.grid(True)
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
 
         # Save the chart to a file
-        chart_filename = 'historical_growth_chart.png'
-        plt.savefig(chart_filename)
-        print(f"✅ Chart saved as '{chart_filename}'")
-        plt.close()
+        fig.savefig(CHART_FILE)
+        print(f"✅ Chart saved as '{CHART_FILE}'")
+        _LAST_CHART = chart_key
 
     except Exception as e:
         print(f"❌ An error occurred while generating the chart: {e}")
@@ -289,19 +527,24 @@ def generate_historical_chart(coin_name):
 def main():
     """Main function to orchestrate the crypto scraper."""
     # --- NEW: Added a continuous loop for auto-updating ---
+    # The browser is only started if the API fails, and is then reused across ticks
+    browser = BrowserSession(headless=True)
+    csv_writer = CsvAppender(FILE_NAME)
     try:
         while True:
-            data = get_top_cryptos(headless=True)
+            # Measure from the start of the tick so slow fetches don't drift the schedule
+            tick_start = time.monotonic()
+            data, fetched_at, from_cache = get_top_cryptos(browser)
 
             if data.empty or len(data) < TOP_N:
                 print("⚠ Scraping finished with incomplete or no data. Please check the error messages above or 'error_screenshot.png'.")
             else:
-                # Display Timestamp in Terminal
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                print(f"\n📈 Market Data as of: {current_time}\n")
+                # Display Timestamp in Terminal (when the data was fetched, not when it was reused)
+                fetch_time = datetime.fromtimestamp(fetched_at).strftime("%Y-%m-%d %H:%M:%S")
+                print(f"\n📈 Market Data as of: {fetch_time}\n")
 
                 print("--- Scraped Data Sample ---")
-                print(tabulate(data, headers='keys', tablefmt='grid', showindex=False))
+                print_table(data)
                 print("--------------------------\n")
 
                 # Perform all analysis
@@ -312,27 +555,38 @@ def main():
                 top_losers = analysis_data.sort_values(by='Change24h_Percent', ascending=True).head(5)
 
                 print("--- Top 5 Gainers (24h) ---")
-                print(tabulate(top_gainers[['Name', 'PriceUSD', 'Change24h_Percent']], headers='keys', tablefmt='grid', showindex=False))
+                print_table(top_gainers[['Name', 'PriceUSD', 'Change24h_Percent']])
                 print("---------------------------\n")
                 
                 print("--- Top 5 Losers (24h) ----")
-                print(tabulate(top_losers[['Name', 'PriceUSD', 'Change24h_Percent']], headers='keys', tablefmt='grid', showindex=False))
+                print_table(top_losers[['Name', 'PriceUSD', 'Change24h_Percent']])
                 print("---------------------------\n")
 
-                display_advanced_analysis(analysis_data.copy())
-                display_highly_advanced_analysis(analysis_data)
-                display_recommendation_assistant(analysis_data.copy())
+                # Only the statistics run on the compact dtypes; everything printed uses the float64 values
+                stats = compute_stats(analysis_data.astype(COLUMN_DTYPES))
+                display_advanced_analysis(analysis_data, stats)
+                display_highly_advanced_analysis(analysis_data, stats)
+                display_recommendation_assistant(analysis_data, stats)
                 
-                save_to_csv(data, FILE_NAME)
+                # Cached data was already logged on the tick that fetched it
+                if from_cache:
+                    print("♻️  Cached data is already in the CSV log; nothing new to append.")
+                else:
+                    csv_writer.append(data, fetched_at)
 
             # Wait for the next update
-            print(f"\n🕒 Waiting {UPDATE_INTERVAL_SECONDS} seconds for the next update... (Press Ctrl+C to stop)")
-            time.sleep(UPDATE_INTERVAL_SECONDS)
+            remaining = max(0.0, UPDATE_INTERVAL_SECONDS - (time.monotonic() - tick_start))
+            print(f"\n🕒 Waiting {remaining:.1f} seconds for the next update... (Press Ctrl+C to stop)")
+            time.sleep(remaining)
 
     except KeyboardInterrupt:
         print("\n\n🛑 Auto-updating stopped by user. Exiting.")
     except Exception as e:
         print(f"\nAn unexpected error occurred: {e}")
+    finally:
+        browser.quit()
+        csv_writer.close()
+        CLIENT.close()
 
 
 if __name__ == "__main__":